@@ -20,51 +20,137 @@ Usage:
 
 import os
 import sys
+import json
+import logging
+import logging.handlers
+import mmap
+import queue
+import struct
+import threading
 import torch
-from safetensors.torch import save_file, load_file
+from safetensors import safe_open
+from safetensors.torch import save_file
 import argparse
-import glob
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 
 # Supported file extensions
 SUPPORTED_EXTENSIONS = ['.pth', '.pt', '.bin', '.ckpt']
+SUPPORTED_EXTENSIONS_SET = frozenset(SUPPORTED_EXTENSIONS)
+
+# Mapping from torch dtypes to safetensors dtype names
+SAFETENSORS_DTYPES = {
+    torch.float64: "F64",
+    torch.float32: "F32",
+    torch.float16: "F16",
+    torch.bfloat16: "BF16",
+    torch.int64: "I64",
+    torch.int32: "I32",
+    torch.int16: "I16",
+    torch.int8: "I8",
+    torch.uint8: "U8",
+    torch.bool: "BOOL",
+}
+# FP8 dtypes are only available in newer PyTorch versions
+for _name, _code in (("float8_e4m3fn", "F8_E4M3"), ("float8_e5m2", "F8_E5M2")):
+    if hasattr(torch, _name):
+        SAFETENSORS_DTYPES[getattr(torch, _name)] = _code
+
+# Start the tensor data on a page boundary so downstream loaders can mmap
+# it with aligned (zero-copy) reads
+HEADER_ALIGNMENT = 4096
+
+# Resolve the default pickle module once; the private helper has moved
+# between PyTorch versions, so fall back to stdlib pickle if it is gone
+try:
+    DEFAULT_PICKLE_MODULE = torch.serialization._get_default_pickle_module()
+except AttributeError:
+    import pickle as DEFAULT_PICKLE_MODULE
+
+logger = logging.getLogger("safetensor_converter")
+
+def setup_logging(verbose=False):
+    """Configure buffered console logging (idempotent; also run in pool workers)"""
+
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    if logger.handlers:
+        # Forked pool workers inherit the parent's handler along with any
+        # records still sitting in its buffer; drop those so every worker
+        # does not re-emit the parent's banner on its first flush
+        for handler in logger.handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                handler.buffer.clear()
+    else:
+        # Buffer records in memory and flush in batches so the per-file
+        # status lines do not each pay a stdout lock and write() syscall;
+        # warnings and errors flush immediately
+        logger.addHandler(logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.WARNING,
+            target=logging.StreamHandler(sys.stdout),
+        ))
 
 def is_supported_file(file_path):
     """Check if file has a supported extension"""
     _, ext = os.path.splitext(file_path.lower())
-    return ext in SUPPORTED_EXTENSIONS
+    return ext in SUPPORTED_EXTENSIONS_SET
 
 def get_supported_files(directory):
     """Get all supported files in a directory"""
-    files = []
-    for ext in SUPPORTED_EXTENSIONS:
-        pattern = os.path.join(directory, f"*{ext}")
-        files.extend(glob.glob(pattern))
-    return files
+    # One scandir pass instead of one glob (listdir + fnmatch) per extension
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS_SET
+        ]
+
+def advise_file(file_path, advice_name):
+    """Give the kernel a posix_fadvise hint for a file, where supported"""
+
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
 
 def load_model_file(file_path):
     """Load model file with multiple fallback methods"""
+
+    logger.info(f"Loading file: {file_path}")
+
+    # Checkpoints are read front to back, so ask for aggressive readahead
+    advise_file(file_path, 'POSIX_FADV_SEQUENTIAL')
     
-    print(f"Loading file: {file_path}")
-    
-    # Try different loading methods
+    # Try different loading methods. mmap=True (PyTorch 2.1+) maps tensor
+    # storages from the file instead of reading the whole checkpoint into
+    # RAM; it requires the zip-based format, so the final method stays
+    # without it as a compatibility fallback
     loading_methods = [
-        # Method 1: Standard loading
-        lambda: torch.load(file_path, map_location="cpu"),
-        # Method 2: With weights_only=False for PyTorch 2.6+
-        lambda: torch.load(file_path, map_location="cpu", weights_only=False),
+        # Method 1: Memory-mapped, weights only (also avoids the pickle
+        # code-execution surface)
+        lambda: torch.load(file_path, map_location="cpu", mmap=True, weights_only=True),
+        # Method 2: Memory-mapped with weights_only=False for legacy pickles
+        lambda: torch.load(file_path, map_location="cpu", mmap=True, weights_only=False),
         # Method 3: With pickle_module for compatibility
-        lambda: torch.load(file_path, map_location="cpu", pickle_module=torch.serialization._get_default_pickle_module()),
+        lambda: torch.load(file_path, map_location="cpu", pickle_module=DEFAULT_PICKLE_MODULE),
     ]
     
     for i, method in enumerate(loading_methods, 1):
         try:
             data = method()
-            print(f"✓ Loaded using method {i}")
+            logger.info(f"✓ Loaded using method {i}")
             return data
         except Exception as e:
-            print(f"  Method {i} failed: {str(e)[:100]}...")
+            logger.debug(f"  Method {i} failed: {e}")
             if i == len(loading_methods):
-                print(f"Error: All loading methods failed for {file_path}")
+                logger.error(f"Error: All loading methods failed for {file_path}")
                 raise e
     
     return None
@@ -75,153 +161,270 @@ def extract_state_dict(data):
     if isinstance(data, dict):
         # Check for common checkpoint structures
         if 'model' in data:
-            print("Found checkpoint format with 'model' key")
+            logger.info("Found checkpoint format with 'model' key")
             return data['model']
         elif 'state_dict' in data:
-            print("Found checkpoint format with 'state_dict' key")
+            logger.info("Found checkpoint format with 'state_dict' key")
             return data['state_dict']
         elif 'weights' in data:
-            print("Found checkpoint format with 'weights' key")
+            logger.info("Found checkpoint format with 'weights' key")
             return data['weights']
         elif 'model_state_dict' in data:
-            print("Found checkpoint format with 'model_state_dict' key")
+            logger.info("Found checkpoint format with 'model_state_dict' key")
             return data['model_state_dict']
         else:
             # Assume it's already a state dict
-            print("Using data as state dict")
+            logger.info("Using data as state dict")
             return data
     elif isinstance(data, torch.Tensor):
-        print("Warning: Data is a tensor, converting to dict format")
+        logger.warning("Warning: Data is a tensor, converting to dict format")
         return {"model": data}
     else:
-        print(f"Warning: Unknown data type {type(data)}, converting to dict format")
+        logger.warning(f"Warning: Unknown data type {type(data)}, converting to dict format")
         return {"model": data}
 
 def clean_state_dict(state_dict):
     """Clean state dict by removing module prefixes and handling special cases"""
     
     if not isinstance(state_dict, dict):
-        print("Warning: State dict is not a dictionary")
+        logger.warning("Warning: State dict is not a dictionary")
         return state_dict
-    
+
     # Remove module prefix if present (from DataParallel)
-    new_state_dict = {}
-    module_prefix_count = 0
-    
-    for key, value in state_dict.items():
-        if key.startswith('module.'):
-            new_key = key[7:]  # Remove 'module.' prefix
-            new_state_dict[new_key] = value
-            module_prefix_count += 1
-        else:
-            new_state_dict[key] = value
-    
-    if module_prefix_count > 0:
-        print(f"Removed 'module.' prefix from {module_prefix_count} keys")
-    else:
-        print("No 'module.' prefixes found")
-    
-    return new_state_dict
+    module_prefix_count = sum(1 for key in state_dict if key.startswith('module.'))
+
+    if module_prefix_count == 0:
+        logger.info("No 'module.' prefixes found")
+        return state_dict
+
+    logger.info(f"Removed 'module.' prefix from {module_prefix_count} keys")
+    return {key.removeprefix('module.'): value for key, value in state_dict.items()}
 
 def prepare_tensors(state_dict):
     """Prepare tensors for saving by making them contiguous and independent"""
-    
-    print("Preparing tensors...")
-    
-    # Make all tensors contiguous
-    print("Making tensors contiguous...")
-    for key, value in state_dict.items():
-        if isinstance(value, torch.Tensor):
-            state_dict[key] = value.contiguous()
-    
-    # Clone all tensors to ensure independence
-    print("Cloning tensors to ensure independence...")
+
+    logger.info("Preparing tensors...")
+
+    # safetensors only rejects tensors that share storage with another tensor
+    # in the dict (e.g. tied embeddings), so instead of cloning everything we
+    # track each tensor's backing storage and clone only the actual offenders.
+    # Tensors that are non-contiguous or views into a larger buffer are also
+    # cloned, since their raw storage cannot be written out as-is.
+    seen_storages = {}
     cloned_count = 0
+    total_params = 0
     for key, value in state_dict.items():
-        if isinstance(value, torch.Tensor):
-            state_dict[key] = value.clone()
+        if not isinstance(value, torch.Tensor):
+            continue
+        tensor = value.detach()
+        total_params += tensor.numel()
+        storage = tensor.untyped_storage()
+        storage_id = (storage.data_ptr(), storage.nbytes())
+        needs_clone = (
+            not tensor.is_contiguous()
+            or storage.nbytes() != tensor.numel() * tensor.element_size()
+            or storage_id in seen_storages
+        )
+        if needs_clone:
+            tensor = tensor.clone(memory_format=torch.contiguous_format)
             cloned_count += 1
-    
-    print(f"Cloned {cloned_count} tensors to ensure independence")
-    return state_dict
+        elif storage.nbytes() > 0:
+            seen_storages[storage_id] = key
+        state_dict[key] = tensor
+
+    if cloned_count > 0:
+        logger.info(f"Cloned {cloned_count} shared or non-contiguous tensors")
+    else:
+        logger.info("No shared tensors found, nothing to clone")
+    return state_dict, total_params
+
+def stream_save_file(state_dict, output_file):
+    """Write a safetensors file incrementally, one tensor at a time
+
+    Pre-computes the JSON header and per-tensor offsets, sizes the output
+    file up front, then memory-maps the data region and copies each tensor
+    directly into place. Unlike rebuilding an independent state dict, this
+    never holds a second full copy of the model in RAM.
+    """
+
+    # Compute header and offsets first so any unsupported entry fails
+    # before anything is written
+    header = {}
+    total_bytes = 0
+    for key, value in state_dict.items():
+        if not isinstance(value, torch.Tensor):
+            raise ValueError(f"Cannot save non-tensor value for key '{key}': {type(value)}")
+        dtype_name = SAFETENSORS_DTYPES.get(value.dtype)
+        if dtype_name is None:
+            raise ValueError(f"Unsupported dtype {value.dtype} for key '{key}'")
+        nbytes = value.numel() * value.element_size()
+        header[key] = {
+            "dtype": dtype_name,
+            "shape": list(value.shape),
+            "data_offsets": [total_bytes, total_bytes + nbytes],
+        }
+        total_bytes += nbytes
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    # Pad the header with spaces (valid per the format) so the data
+    # section starts on a page boundary
+    header_bytes += b" " * (-(8 + len(header_bytes)) % HEADER_ALIGNMENT)
+    data_start = 8 + len(header_bytes)
+
+    # w+b: mmap needs a readable fd even for a write mapping
+    with open(output_file, "w+b") as f:
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        f.truncate(data_start + total_bytes)
+        f.flush()
+
+        if total_bytes == 0:
+            return
+
+        with mmap.mmap(f.fileno(), data_start + total_bytes) as mm:
+            # Double-buffered pipeline: a reader thread stages the next
+            # tensor (paging it in, device transfer, contiguous copy)
+            # while the main thread writes the current one into the
+            # mapped file, so reads and writes overlap
+            staged = queue.Queue(maxsize=2)
+
+            def stage_tensors():
+                try:
+                    for key, value in state_dict.items():
+                        start, end = header[key]["data_offsets"]
+                        if end == start:
+                            continue
+                        tensor = value.detach()
+                        if tensor.device.type != "cpu":
+                            tensor = tensor.cpu()
+                        if not tensor.is_contiguous():
+                            tensor = tensor.contiguous()
+                        staged.put((tensor, start))
+                except Exception as e:
+                    staged.put(e)
+                else:
+                    staged.put(None)
+
+            reader = threading.Thread(target=stage_tensors, daemon=True)
+            reader.start()
+            try:
+                while True:
+                    item = staged.get()
+                    if item is None:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    tensor, start = item
+                    dest = torch.frombuffer(
+                        mm, dtype=tensor.dtype, count=tensor.numel(),
+                        offset=data_start + start,
+                    )
+                    dest.copy_(tensor.view(-1))
+                    # Release the buffer view so the mmap can be closed
+                    del dest, tensor, item
+            finally:
+                # Drain the queue so the reader is not left blocked on a
+                # full queue if the write loop bailed out early
+                while reader.is_alive():
+                    try:
+                        staged.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                reader.join()
 
 def save_safetensors(state_dict, output_file):
     """Save state dict to safetensors format with error recovery"""
     
-    print(f"Saving to safetensors file: {output_file}")
-    
+    logger.info(f"Saving to safetensors file: {output_file}")
+
+    # Prefer the streaming writer: it controls the file layout, so it can
+    # page-align the data section (save_file only aligns to 8 bytes, and
+    # growing the header afterwards would mean shifting all tensor data),
+    # it never holds a second copy of the model, and shared tensors are
+    # not a problem since each one is copied out independently. It
+    # validates the whole dict before writing, so falling back is safe.
+    try:
+        stream_save_file(state_dict, output_file)
+        logger.info("✓ Saved using streaming writer")
+        return True
+    except Exception as e:
+        logger.warning(f"Streaming writer failed, falling back to save_file: {e}")
+
     try:
         save_file(state_dict, output_file)
-        print("✓ Saved using standard method")
+        logger.info("✓ Saved using standard method")
         return True
     except RuntimeError as e:
         if "Some tensors share memory" in str(e):
-            print("Error: Shared tensors detected. Trying alternative approach...")
+            logger.warning("Shared tensors detected. Trying alternative approach...")
             try:
-                # Force all tensors to be completely independent
+                # Force all tensors to be completely independent. clone()
+                # is a single copy that keeps dtype and device, and unlike
+                # a numpy() roundtrip it also works for bf16/fp8 tensors
                 independent_state_dict = {}
                 for key, value in state_dict.items():
                     if isinstance(value, torch.Tensor):
-                        # Create completely new tensor
-                        independent_state_dict[key] = torch.tensor(
-                            value.cpu().numpy(), 
-                            dtype=value.dtype, 
-                            device=value.device
-                        )
+                        independent_state_dict[key] = value.detach().clone()
                     else:
                         independent_state_dict[key] = value
                 
                 save_file(independent_state_dict, output_file)
-                print("✓ Saved using alternative approach")
+                logger.info("✓ Saved using alternative approach")
                 return True
             except Exception as e2:
-                print(f"Alternative approach also failed: {e2}")
+                logger.error(f"Alternative approach also failed: {e2}")
                 return False
         else:
-            print(f"Error during save: {e}")
+            logger.error(f"Error during save: {e}")
             return False
     except Exception as e:
-        print(f"Unexpected error during save: {e}")
+        logger.error(f"Unexpected error during save: {e}")
         return False
 
 def verify_saved_file(output_file):
     """Verify the saved safetensors file"""
     
     if not os.path.exists(output_file):
-        print("Error: Output file was not created!")
+        logger.error("Error: Output file was not created!")
         return False
-    
+
     file_size = os.path.getsize(output_file)
-    print(f"✓ File created successfully!")
-    print(f"  Output file: {output_file}")
-    print(f"  File size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
-    
-    # Verify the saved file structure
+    logger.info(f"✓ File created successfully!")
+    logger.info(f"  Output file: {output_file}")
+    logger.info(f"  File size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
+
+    # Verify the saved file structure. safe_open parses only the JSON
+    # header, so no tensor data is read back into RAM
     try:
-        verify_data = load_file(output_file)
-        module_keys = [k for k in verify_data.keys() if k.startswith('module.')]
+        with safe_open(output_file, framework="pt") as verify_data:
+            module_keys = [k for k in verify_data.keys() if k.startswith('module.')]
         if module_keys:
-            print(f"  WARNING: Saved file still has {len(module_keys)} keys with 'module.' prefix")
-            print(f"  This may cause loading issues!")
-            return False
+            logger.warning(f"  WARNING: Saved file still has {len(module_keys)} keys with 'module.' prefix")
+            logger.warning(f"  This may cause loading issues!")
+            verified = False
         else:
-            print(f"  ✓ Verified: No 'module.' prefixes in saved file")
-            return True
+            logger.info(f"  ✓ Verified: No 'module.' prefixes in saved file")
+            verified = True
     except Exception as e:
-        print(f"  WARNING: Could not verify saved file: {e}")
-        return False
+        logger.warning(f"  WARNING: Could not verify saved file: {e}")
+        verified = False
+
+    # Drop the output from the page cache so a big file we will not read
+    # again does not evict pages needed by the next conversion
+    advise_file(output_file, 'POSIX_FADV_DONTNEED')
+    return verified
 
 def convert_file(input_file, output_file=None):
     """Convert a single file to safetensors format"""
     
     # Check if input file exists
     if not os.path.exists(input_file):
-        print(f"Error: Input file '{input_file}' does not exist!")
+        logger.error(f"Error: Input file '{input_file}' does not exist!")
         return False
-    
+
     # Check if file format is supported
     if not is_supported_file(input_file):
-        print(f"Error: File format not supported. Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}")
+        logger.error(f"Error: File format not supported. Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}")
         return False
     
     # Generate output filename if not provided
@@ -238,26 +441,27 @@ def convert_file(input_file, output_file=None):
         
         # Clean state dict
         state_dict = clean_state_dict(state_dict)
-        
+
+        # Prepare tensors; the same pass counts parameters so we do not
+        # walk the whole dict a second time just for the summary line
+        state_dict, total_params = prepare_tensors(state_dict)
+
         # Show information
-        print(f"State dict contains {len(state_dict)} keys")
-        total_params = sum(p.numel() for p in state_dict.values() if hasattr(p, 'numel'))
-        print(f"Total parameters: {total_params:,}")
-        
-        # Show sample keys
-        print("Sample keys:")
-        for i, key in enumerate(list(state_dict.keys())[:5]):
+        logger.info(f"State dict contains {len(state_dict)} keys")
+        logger.info(f"Total parameters: {total_params:,}")
+
+        # Show sample keys; islice yields the first few keys without
+        # materializing the full key list
+        logger.info("Sample keys:")
+        for key in islice(state_dict, 5):
             if hasattr(state_dict[key], 'shape'):
-                print(f"  {key}: {state_dict[key].shape}")
+                logger.info(f"  {key}: {state_dict[key].shape}")
             else:
-                print(f"  {key}: {type(state_dict[key])}")
-        
+                logger.info(f"  {key}: {type(state_dict[key])}")
+
         if len(state_dict) > 5:
-            print(f"  ... and {len(state_dict) - 5} more keys")
-        
-        # Prepare tensors
-        state_dict = prepare_tensors(state_dict)
-        
+            logger.info(f"  ... and {len(state_dict) - 5} more keys")
+
         # Save to safetensors
         if not save_safetensors(state_dict, output_file):
             return False
@@ -266,18 +470,34 @@ def convert_file(input_file, output_file=None):
         if not verify_saved_file(output_file):
             return False
         
-        print("✓ Conversion completed successfully!")
+        logger.info("✓ Conversion completed successfully!")
         return True
-        
+
     except Exception as e:
-        print(f"Error during conversion: {e}")
+        logger.error(f"Error during conversion: {e}")
         return False
 
-def batch_convert(input_dir, output_dir=None):
+def convert_file_wrapper(file_path, output_dir):
+    """Convert a single file into output_dir (process pool worker)"""
+
+    filename = os.path.basename(file_path)
+    output_path = os.path.join(output_dir, os.path.splitext(filename)[0] + '.safetensors')
+
+    logger.info(f"\n--- Converting {filename} ---")
+    try:
+        return convert_file(file_path, output_path)
+    finally:
+        # Pool workers exit via os._exit, which skips the atexit
+        # logging.shutdown, so flush the buffered records per file or
+        # they are dropped when the worker dies
+        for handler in logger.handlers:
+            handler.flush()
+
+def batch_convert(input_dir, output_dir=None, jobs=None, verbose=False):
     """Batch convert all supported files in a directory"""
-    
+
     if not os.path.isdir(input_dir):
-        print(f"Error: Input directory '{input_dir}' does not exist!")
+        logger.error(f"Error: Input directory '{input_dir}' does not exist!")
         return
     
     if output_dir is None:
@@ -289,26 +509,41 @@ def batch_convert(input_dir, output_dir=None):
     supported_files = get_supported_files(input_dir)
     
     if not supported_files:
-        print(f"No supported files found in '{input_dir}'")
-        print(f"Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}")
+        logger.error(f"No supported files found in '{input_dir}'")
+        logger.error(f"Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}")
         return
-    
-    print(f"Found {len(supported_files)} supported files to convert:")
+
+    logger.info(f"Found {len(supported_files)} supported files to convert:")
     for f in supported_files:
-        print(f"  - {f}")
-    
-    print("\nStarting batch conversion...")
-    
-    success_count = 0
-    for file_path in supported_files:
-        filename = os.path.basename(file_path)
-        output_path = os.path.join(output_dir, os.path.splitext(filename)[0] + '.safetensors')
-        
-        print(f"\n--- Converting {filename} ---")
-        if convert_file(file_path, output_path):
-            success_count += 1
-    
-    print(f"\nBatch conversion complete: {success_count}/{len(supported_files)} files converted successfully")
+        logger.info(f"  - {f}")
+
+    logger.info("\nStarting batch conversion...")
+
+    # Default to half the CPUs: conversions are mostly I/O plus pickle
+    # decompression, so a few workers keep the disk busy without the RAM
+    # cost of loading many models at once
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 2) // 2)
+    jobs = max(1, min(jobs, len(supported_files)))
+
+    if jobs == 1:
+        results = [convert_file_wrapper(f, output_dir) for f in supported_files]
+    else:
+        logger.info(f"Using {jobs} parallel workers")
+        # Emit everything buffered so far; the workers we are about to
+        # fork would otherwise inherit and re-emit it
+        for handler in logger.handlers:
+            handler.flush()
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=setup_logging,
+                                 initargs=(verbose,)) as executor:
+            results = list(executor.map(
+                partial(convert_file_wrapper, output_dir=output_dir),
+                supported_files
+            ))
+
+    success_count = sum(1 for result in results if result)
+    logger.info(f"\nBatch conversion complete: {success_count}/{len(supported_files)} files converted successfully")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -330,19 +565,25 @@ Supported formats: .pth, .pt, .bin, .ckpt
     parser.add_argument("input", help="Input file or directory")
     parser.add_argument("-o", "--output", help="Output file or directory")
     parser.add_argument("--batch", action="store_true", help="Batch convert all supported files in directory")
-    
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Number of parallel conversions in batch mode (default: half the CPUs; use 1 for large models)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Show debug output such as individual loading-method failures")
+
     args = parser.parse_args()
-    
+
+    setup_logging(args.verbose)
+
     if args.batch or os.path.isdir(args.input):
         # Batch mode
-        batch_convert(args.input, args.output)
+        batch_convert(args.input, args.output, jobs=args.jobs, verbose=args.verbose)
     else:
         # Single file mode
         success = convert_file(args.input, args.output)
         if success:
-            print("\n✓ Conversion completed successfully!")
+            logger.info("\n✓ Conversion completed successfully!")
         else:
-            print("\n✗ Conversion failed!")
+            logger.error("\n✗ Conversion failed!")
             sys.exit(1)
 
 if __name__ == "__main__":